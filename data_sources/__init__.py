@@ -3,5 +3,6 @@ Data source modules for trading bot.
 """
 
 from .dexscreener import DexScreener, TokenPair
+from ._candle_cache import load_cached_candles, save_cached_candles
 
-__all__ = ['DexScreener', 'TokenPair']
+__all__ = ['DexScreener', 'TokenPair', 'load_cached_candles', 'save_cached_candles']
@@ -0,0 +1,67 @@
+"""
+Disk cache for candle fetches.
+
+Candles are stored as plain .npy files under ~/.cache/kraken-bot, keyed by
+a hash of (exchange, symbol, timeframe, start, end). Re-running a backtest
+or signal test on the same period then reads from disk instead of the network.
+"""
+
+import hashlib
+import os
+import time
+from typing import Optional
+
+import numpy as np
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'kraken-bot')
+
+
+def _cache_path(exchange: str, symbol: str, timeframe, start, end) -> str:
+    """Path of the cache file for a request."""
+    key = hashlib.sha256(f"{exchange}|{symbol}|{timeframe}|{start}|{end}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.npy")
+
+
+def load_cached_candles(
+    exchange: str,
+    symbol: str,
+    timeframe,
+    start,
+    end,
+    ttl: Optional[float] = None,
+) -> Optional[np.ndarray]:
+    """
+    Load candles from the cache.
+    
+    Args:
+        exchange, symbol, timeframe, start, end: Request parameters used as the key
+        ttl: Max age in seconds (by file mtime); None means never expire
+    
+    Returns:
+        Read-only memory-mapped candle array, or None on a miss
+    """
+    path = _cache_path(exchange, symbol, timeframe, start, end)
+    try:
+        if ttl is not None and time.time() - os.path.getmtime(path) > ttl:
+            return None
+        return np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached_candles(exchange: str, symbol: str, timeframe, start, end, candles: np.ndarray) -> str:
+    """
+    Write candles to the cache.
+    
+    Returns:
+        Path of the cache file
+    """
+    path = _cache_path(exchange, symbol, timeframe, start, end)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    
+    # Write then rename so readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        np.save(f, np.asarray(candles))
+    os.replace(tmp_path, path)
+    return path
@@ -8,7 +8,8 @@ Docs: https://docs.dexscreener.com/api/reference
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -58,13 +59,17 @@ class DexScreener:
     """Client for DexScreener API."""
     
     BASE_URL = "https://api.dexscreener.com"
+    HEADERS = {
+        'Accept': 'application/json',
+        'User-Agent': 'SodaPoppy-TradingBot/1.0'
+    }
+    PAIR_CACHE_SIZE = 512
     
     def __init__(self):
         self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/json',
-            'User-Agent': 'SodaPoppy-TradingBot/1.0'
-        })
+        self.session.headers.update(self.HEADERS)
+        # query -> (chain, pair_address) of its highest liquidity pair, LRU ordered
+        self._pair_lookup: OrderedDict[str, Tuple[str, str]] = OrderedDict()
     
     def _get(self, endpoint: str) -> Optional[Dict]:
         """Make GET request to DexScreener API."""
@@ -76,6 +81,20 @@ class DexScreener:
             print(f"❌ DexScreener API error: {e}")
             return None
     
+    async def _get_async(self, session, endpoint: str) -> Optional[Dict]:
+        """
+        Make GET request to DexScreener API on an aiohttp session.
+        
+        The session should be created with `HEADERS` and a timeout.
+        """
+        try:
+            async with session.get(f"{self.BASE_URL}{endpoint}") as response:
+                response.raise_for_status()
+                return await response.json()
+        except Exception as e:
+            print(f"❌ DexScreener API error: {e}")
+            return None
+    
     def _parse_pair(self, data: Dict) -> Optional[TokenPair]:
         """Parse API response into TokenPair object."""
         try:
@@ -103,6 +122,19 @@ class DexScreener:
             print(f"⚠️ Failed to parse pair: {e}")
             return None
     
+    def _parse_pairs(self, data: Optional[Dict]) -> List[TokenPair]:
+        """Parse the top 20 pairs of a search response, skipping unparseable ones."""
+        if not data or 'pairs' not in data:
+            return []
+        
+        pairs = []
+        for pair_data in data['pairs'][:20]:  # Limit to top 20
+            pair = self._parse_pair(pair_data)
+            if pair:
+                pairs.append(pair)
+        
+        return pairs
+    
     def search_tokens(self, query: str) -> List[TokenPair]:
         """
         Search for tokens by name or symbol.
@@ -114,16 +146,21 @@ class DexScreener:
             List of matching TokenPairs
         """
         data = self._get(f"/latest/dex/search?q={query}")
-        if not data or 'pairs' not in data:
-            return []
-        
-        pairs = []
-        for pair_data in data['pairs'][:20]:  # Limit to top 20
-            pair = self._parse_pair(pair_data)
-            if pair:
-                pairs.append(pair)
+        return self._parse_pairs(data)
+    
+    async def search_tokens_async(self, session, query: str) -> List[TokenPair]:
+        """Async version of search_tokens using an aiohttp session."""
+        data = await self._get_async(session, f"/latest/dex/search?q={query}")
+        return self._parse_pairs(data)
+    
+    async def get_pair_async(self, session, chain: str, pair_address: str) -> Optional[TokenPair]:
+        """Fetch a single pair by chain and pair address."""
+        data = await self._get_async(session, f"/latest/dex/pairs/{chain}/{pair_address}")
+        if not data:
+            return None
         
-        return pairs
+        pair_data = data.get('pair') or (data.get('pairs') or [None])[0]
+        return self._parse_pair(pair_data) if pair_data else None
     
     def get_token_pairs(self, chain: str, token_address: str) -> List[TokenPair]:
         """
@@ -193,6 +230,36 @@ class DexScreener:
         # Get highest liquidity pair
         pair = max(pairs, key=lambda p: p.liquidity_usd)
         
+        return self._analyze_pair(pair)
+    
+    async def analyze_token_async(self, session, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Async version of analyze_token using an aiohttp session.
+        
+        The pair picked for a query is remembered, so repeat calls fetch that
+        pair directly instead of running a search first.
+        """
+        pair = None
+        cached = self._pair_lookup.get(query)
+        if cached:
+            self._pair_lookup.move_to_end(query)
+            pair = await self.get_pair_async(session, *cached)
+        
+        if pair is None:
+            pairs = await self.search_tokens_async(session, query)
+            if not pairs:
+                return None
+            
+            # Get highest liquidity pair
+            pair = max(pairs, key=lambda p: p.liquidity_usd)
+            self._pair_lookup[query] = (pair.chain, pair.pair_address)
+            if len(self._pair_lookup) > self.PAIR_CACHE_SIZE:
+                self._pair_lookup.popitem(last=False)
+        
+        return self._analyze_pair(pair)
+    
+    def _analyze_pair(self, pair: TokenPair) -> Dict[str, Any]:
+        """Build the analysis dict with signal for a pair."""
         # Simple signal logic
         signal = "NEUTRAL"
         reasons = []
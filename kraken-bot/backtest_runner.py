@@ -7,20 +7,34 @@ Usage:
     python backtest_runner.py --all  # Run all strategies on default config
 """
 import argparse
+import os
 import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 
 # Jesse imports
 from jesse.research import backtest, get_candles, import_candles
 
+# Shared data sources live at the repo root
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from data_sources import load_cached_candles, save_cached_candles
+
 # Local imports
 from config import BACKTEST_CONFIG, DEFAULT_ROUTES, DEFAULT_DATA_ROUTES, STRATEGY_MAP
 from strategies import GoldenCross, RSIMeanReversion, MomentumROC
 
 
+STRATEGY_CLASSES = {
+    'GoldenCross': GoldenCross,
+    'RSIMeanReversion': RSIMeanReversion,
+    'MomentumROC': MomentumROC,
+}
+
+
 def fetch_candles(
     exchange: str,
     symbol: str,
@@ -31,6 +45,10 @@ def fetch_candles(
     """
     Fetch historical candles for backtesting.
     
+    Results are cached on disk, so re-running the same period skips the fetch.
+    The returned array is a read-only memory map of the cache file, or the
+    fetched array itself if the cache couldn't be written.
+    
     Args:
         exchange: Exchange name (e.g., 'Kraken Futures')
         symbol: Trading pair (e.g., 'BTC-USDT')
@@ -39,10 +57,16 @@ def fetch_candles(
         timeframe: Candle timeframe (e.g., '1h', '4h', '1D')
     
     Returns:
-        NumPy array of candles
+        NumPy array of candles (an np.memmap whose `.filename` is the cache file
+        when cached)
     """
     print(f"📊 Fetching candles: {exchange} {symbol} {timeframe}")
-    print(f"   Period: {start_date} to {end_date}")
+    print(f"   Period: {start_date} to {end_date}", flush=True)
+    
+    cached = load_cached_candles(exchange, symbol, timeframe, start_date, end_date)
+    if cached is not None:
+        print(f"   ✅ Loaded {len(cached)} candles from cache", flush=True)
+        return cached
     
     try:
         candles = get_candles(
@@ -52,11 +76,17 @@ def fetch_candles(
             start_date_str=start_date,
             finish_date_str=end_date,
         )
-        print(f"   ✅ Fetched {len(candles)} candles")
-        return candles
+        print(f"   ✅ Fetched {len(candles)} candles", flush=True)
     except Exception as e:
         print(f"   ❌ Error fetching candles: {e}")
         raise
+    
+    try:
+        cache_path = save_cached_candles(exchange, symbol, timeframe, start_date, end_date, candles)
+    except OSError as e:
+        print(f"   ⚠️ Couldn't cache candles: {e}", flush=True)
+        return candles
+    return np.load(cache_path, mmap_mode='r')
 
 
 def run_backtest(
@@ -99,37 +129,93 @@ def run_backtest(
     return results
 
 
+def _run_one(
+    strategy_name: str,
+    config: Dict,
+    routes: List[Dict],
+    data_routes: List[Dict],
+    candles_source: Union[str, np.ndarray],
+    exchange: str,
+    symbol: str,
+) -> Dict:
+    """
+    Worker entry point for parallel backtests.
+    
+    Top-level so it can be pickled by ProcessPoolExecutor. When
+    `candles_source` is a cache file path, candles are memory-mapped from it
+    rather than pickled into every worker, so all workers share the same
+    pages through the OS page cache. Otherwise it is the candle array itself.
+    """
+    if isinstance(candles_source, str):
+        candles_source = np.load(candles_source, mmap_mode='r')
+    
+    candles = {
+        f"{exchange}-{symbol}": {
+            'exchange': exchange,
+            'symbol': symbol,
+            'candles': candles_source,
+        }
+    }
+    
+    return run_backtest(
+        strategy_class=STRATEGY_CLASSES[strategy_name],
+        config=config,
+        routes=routes,
+        data_routes=data_routes,
+        candles=candles,
+    )
+
+
+def _report_failure(strategy_name: str, error: Exception):
+    """
+    Print a failed backtest with its full traceback.
+    
+    For pool workers the remote traceback is chained as `__cause__`, so it
+    is included too.
+    """
+    print(f"   ❌ {strategy_name} failed: {error}", flush=True)
+    traceback.print_exception(error)
+
+
 def print_results(results: Dict, strategy_name: str):
     """
     Print formatted backtest results.
     """
-    print(f"\n{'='*60}")
-    print(f"📈 BACKTEST RESULTS: {strategy_name}")
-    print(f"{'='*60}")
+    lines = [
+        f"\n{'='*60}",
+        f"📈 BACKTEST RESULTS: {strategy_name}",
+        f"{'='*60}",
+    ]
     
     if 'metrics' in results:
         m = results['metrics']
-        print(f"\n💰 Performance:")
-        print(f"   Starting Balance: ${m.get('starting_balance', 0):,.2f}")
-        print(f"   Final Balance:    ${m.get('final_balance', 0):,.2f}")
-        print(f"   Total Return:     {m.get('total_return_percentage', 0):.2f}%")
-        print(f"   Annual Return:    {m.get('annual_return_percentage', 0):.2f}%")
-        
-        print(f"\n📊 Trade Statistics:")
-        print(f"   Total Trades:     {m.get('total_trades', 0)}")
-        print(f"   Win Rate:         {m.get('win_rate', 0):.1f}%")
-        print(f"   Profit Factor:    {m.get('profit_factor', 0):.2f}")
-        print(f"   Avg Win:          ${m.get('average_win', 0):,.2f}")
-        print(f"   Avg Loss:         ${m.get('average_loss', 0):,.2f}")
-        
-        print(f"\n⚠️  Risk Metrics:")
-        print(f"   Max Drawdown:     {m.get('max_drawdown_percentage', 0):.2f}%")
-        print(f"   Sharpe Ratio:     {m.get('sharpe_ratio', 0):.2f}")
-        print(f"   Sortino Ratio:    {m.get('sortino_ratio', 0):.2f}")
+        lines += [
+            f"\n💰 Performance:",
+            f"   Starting Balance: ${m.get('starting_balance', 0):,.2f}",
+            f"   Final Balance:    ${m.get('final_balance', 0):,.2f}",
+            f"   Total Return:     {m.get('total_return_percentage', 0):.2f}%",
+            f"   Annual Return:    {m.get('annual_return_percentage', 0):.2f}%",
+            
+            f"\n📊 Trade Statistics:",
+            f"   Total Trades:     {m.get('total_trades', 0)}",
+            f"   Win Rate:         {m.get('win_rate', 0):.1f}%",
+            f"   Profit Factor:    {m.get('profit_factor', 0):.2f}",
+            f"   Avg Win:          ${m.get('average_win', 0):,.2f}",
+            f"   Avg Loss:         ${m.get('average_loss', 0):,.2f}",
+            
+            f"\n⚠️  Risk Metrics:",
+            f"   Max Drawdown:     {m.get('max_drawdown_percentage', 0):.2f}%",
+            f"   Sharpe Ratio:     {m.get('sharpe_ratio', 0):.2f}",
+            f"   Sortino Ratio:    {m.get('sortino_ratio', 0):.2f}",
+        ]
     else:
-        print("   ⚠️ No metrics available in results")
+        lines.append("   ⚠️ No metrics available in results")
+    
+    lines.append(f"\n{'='*60}\n")
     
-    print(f"\n{'='*60}\n")
+    # One write per report
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 
 def main():
@@ -145,6 +231,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Block-buffer stdout; progress lines below flush explicitly
+    sys.stdout.reconfigure(line_buffering=False)
+    
     # Validate arguments
     if not args.strategy and not args.all:
         parser.error("Please specify --strategy or --all")
@@ -154,12 +243,7 @@ def main():
     if args.all:
         strategies = [GoldenCross, RSIMeanReversion, MomentumROC]
     else:
-        strategy_map = {
-            'GoldenCross': GoldenCross,
-            'RSIMeanReversion': RSIMeanReversion,
-            'MomentumROC': MomentumROC,
-        }
-        strategies = [strategy_map[args.strategy]]
+        strategies = [STRATEGY_CLASSES[args.strategy]]
     
     # Update config
     config = BACKTEST_CONFIG.copy()
@@ -167,7 +251,6 @@ def main():
     
     # Fetch candles
     exchange = 'Kraken Futures'
-    candle_key = f"{exchange}-{args.symbol}"
     
     try:
         candle_data = fetch_candles(
@@ -183,30 +266,58 @@ def main():
         print("   Or use a different data source / exchange that has historical data available")
         sys.exit(1)
     
-    candles = {
-        candle_key: {
-            'exchange': exchange,
-            'symbol': args.symbol,
-            'candles': candle_data,
-        }
-    }
+    # Workers map the cache file that backs candle_data, if it was cached
+    candles_source = candle_data.filename if isinstance(candle_data, np.memmap) else candle_data
     
-    # Run backtests
+    jobs = {}
     for strategy_class in strategies:
         routes = [
-            {'exchange': exchange, 'strategy': strategy_class.__name__, 
+            {'exchange': exchange, 'strategy': strategy_class.__name__,
              'symbol': args.symbol, 'timeframe': args.timeframe}
         ]
-        
-        results = run_backtest(
-            strategy_class=strategy_class,
-            config=config,
-            routes=routes,
-            data_routes=[],
-            candles=candles,
+        jobs[strategy_class.__name__] = (
+            strategy_class.__name__,
+            config,
+            routes,
+            [],
+            candles_source,
+            exchange,
+            args.symbol,
         )
-        
-        print_results(results, strategy_class.__name__)
+    
+    all_results = {}
+    failed = []
+    if len(jobs) == 1:
+        # A single backtest isn't worth a process pool
+        strategy_name, job = next(iter(jobs.items()))
+        try:
+            all_results[strategy_name] = _run_one(*job)
+            print(f"   ✅ {strategy_name} finished", flush=True)
+        except Exception as e:
+            failed.append(strategy_name)
+            _report_failure(strategy_name, e)
+    else:
+        # Run backtests in parallel, one process per strategy
+        max_workers = min(len(jobs), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_run_one, *job): name for name, job in jobs.items()}
+            
+            for future in as_completed(futures):
+                strategy_name = futures[future]
+                try:
+                    all_results[strategy_name] = future.result()
+                    print(f"   ✅ {strategy_name} finished", flush=True)
+                except Exception as e:
+                    failed.append(strategy_name)
+                    _report_failure(strategy_name, e)
+    
+    for strategy_class in strategies:
+        if strategy_class.__name__ in all_results:
+            print_results(all_results[strategy_class.__name__], strategy_class.__name__)
+    
+    if failed:
+        print(f"❌ Backtesting failed for: {', '.join(failed)}")
+        sys.exit(1)
     
     print("✅ Backtesting complete!")
 
@@ -12,55 +12,58 @@ Usage:
 """
 
 import argparse
-import time
+import asyncio
+import sys
 from datetime import datetime
+
+import numpy as np
+
 from data_sources.dexscreener import DexScreener
 
 
+_SIGNAL_LABELS = ("🟢 BULLISH", "🔴 BEARISH", "⚪ NEUTRAL")
+_PRICE_FORMATS = ("${:.8f}", "${:.6f}", "${:,.2f}")
+_VOLUME_FORMATS = ("${:.1f}M", "${:.0f}K", "${:.0f}")
+
+
 def print_pair_table(pairs, title=""):
     """Print pairs in a nice table format."""
+    lines = []
     if title:
-        print(f"\n{title}")
-        print("=" * 80)
-    
-    print(f"{'Token':<15} {'Price':<14} {'1h':<8} {'24h':<8} {'Volume':<12} {'Signal':<10}")
-    print("-" * 80)
-    
-    for pair in pairs:
-        # Determine signal emoji
-        if pair.price_change_1h > 5 and pair.buy_sell_ratio > 1.2:
-            signal = "🟢 BULLISH"
-        elif pair.price_change_1h < -5 or pair.buy_sell_ratio < 0.7:
-            signal = "🔴 BEARISH"
-        else:
-            signal = "⚪ NEUTRAL"
-        
-        # Format price
-        if pair.price_usd < 0.00001:
-            price_str = f"${pair.price_usd:.8f}"
-        elif pair.price_usd < 1:
-            price_str = f"${pair.price_usd:.6f}"
-        else:
-            price_str = f"${pair.price_usd:,.2f}"
-        
-        # Format volume
-        if pair.volume_24h >= 1_000_000:
-            vol_str = f"${pair.volume_24h/1_000_000:.1f}M"
-        elif pair.volume_24h >= 1_000:
-            vol_str = f"${pair.volume_24h/1_000:.0f}K"
-        else:
-            vol_str = f"${pair.volume_24h:.0f}"
-        
+        lines.append(f"\n{title}")
+        lines.append("=" * 80)
+    
+    lines.append(f"{'Token':<15} {'Price':<14} {'1h':<8} {'24h':<8} {'Volume':<12} {'Signal':<10}")
+    lines.append("-" * 80)
+    
+    # Classify every pair at once, leaving only formatting in the loop
+    n = len(pairs)
+    p1h = np.fromiter((p.price_change_1h for p in pairs), dtype=np.float64, count=n)
+    bsr = np.fromiter((p.buy_sell_ratio for p in pairs), dtype=np.float64, count=n)
+    price = np.fromiter((p.price_usd for p in pairs), dtype=np.float64, count=n)
+    volume = np.fromiter((p.volume_24h for p in pairs), dtype=np.float64, count=n)
+    
+    signals = np.select([(p1h > 5) & (bsr > 1.2), (p1h < -5) | (bsr < 0.7)], [0, 1], default=2)
+    price_fmt = np.select([price < 0.00001, price < 1], [0, 1], default=2)
+    vol_fmt = np.select([volume >= 1_000_000, volume >= 1_000], [0, 1], default=2)
+    vol_scaled = volume / np.select([vol_fmt == 0, vol_fmt == 1], [1_000_000, 1_000], default=1)
+    
+    for i, pair in enumerate(pairs):
+        price_str = _PRICE_FORMATS[price_fmt[i]].format(price[i])
+        vol_str = _VOLUME_FORMATS[vol_fmt[i]].format(vol_scaled[i])
         symbol = pair.base_token.get('symbol', '???')[:12]
         
-        print(f"{symbol:<15} {price_str:<14} {pair.price_change_1h:+6.1f}% {pair.price_change_24h:+6.1f}% {vol_str:<12} {signal}")
+        lines.append(f"{symbol:<15} {price_str:<14} {pair.price_change_1h:+6.1f}% {pair.price_change_24h:+6.1f}% {vol_str:<12} {_SIGNAL_LABELS[signals[i]]}")
     
-    print()
+    # One write for the whole table
+    lines.append("")
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
 
 
 def scan_trending(dex: DexScreener, chain: str = 'solana'):
     """Scan trending meme coins."""
-    print(f"🔍 Scanning trending meme coins on {chain.upper()}...")
+    print(f"🔍 Scanning trending meme coins on {chain.upper()}...", flush=True)
     
     pairs = dex.get_trending(chain)
     
@@ -82,7 +85,7 @@ def scan_trending(dex: DexScreener, chain: str = 'solana'):
 
 def search_token(dex: DexScreener, query: str):
     """Search and analyze a specific token."""
-    print(f"🔍 Searching for {query}...")
+    print(f"🔍 Searching for {query}...", flush=True)
     
     analysis = dex.analyze_token(query)
     
@@ -112,24 +115,29 @@ def search_token(dex: DexScreener, query: str):
     print(f"\nChart: {analysis['url']}")
 
 
-def watch_tokens(dex: DexScreener, tokens: list, interval: int = 30):
-    """Watch specific tokens with live updates."""
+async def watch_tokens_async(dex: DexScreener, tokens: list, interval: int = 30):
+    """Watch specific tokens with live updates, fetching all tokens concurrently."""
+    # Only --watch needs aiohttp; keep the other modes usable without it
+    import aiohttp
+    
     print(f"👀 Watching: {', '.join(tokens)}")
-    print(f"   Refreshing every {interval}s (Ctrl+C to stop)\n")
+    print(f"   Refreshing every {interval}s (Ctrl+C to stop)\n", flush=True)
     
-    try:
+    signal_emoji = {"BULLISH": "🟢", "BEARISH": "🔴", "NEUTRAL": "⚪"}
+    timeout = aiohttp.ClientTimeout(total=10)
+    
+    async with aiohttp.ClientSession(headers=dex.HEADERS, timeout=timeout) as session:
         while True:
-            print(f"\n--- {datetime.now().strftime('%H:%M:%S')} ---")
+            results = await asyncio.gather(*(dex.analyze_token_async(session, t) for t in tokens))
             
-            for token in tokens:
-                analysis = dex.analyze_token(token)
+            lines = [f"\n--- {datetime.now().strftime('%H:%M:%S')} ---"]
+            for token, analysis in zip(tokens, results):
                 if analysis:
-                    signal_emoji = {"BULLISH": "🟢", "BEARISH": "🔴", "NEUTRAL": "⚪"}
-                    print(f"{token}: ${analysis['price']:.6f} | {analysis['price_change_1h']:+.1f}% 1h | {signal_emoji.get(analysis['signal'], '❓')} {analysis['signal']}")
+                    lines.append(f"{token}: ${analysis['price']:.6f} | {analysis['price_change_1h']:+.1f}% 1h | {signal_emoji.get(analysis['signal'], '❓')} {analysis['signal']}")
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
             
-            time.sleep(interval)
-    except KeyboardInterrupt:
-        print("\n\n👋 Stopped watching")
+            await asyncio.sleep(interval)
 
 
 def main():
@@ -141,12 +149,18 @@ def main():
     
     args = parser.parse_args()
     
+    # Block-buffer stdout; output is written in batches and flushed explicitly
+    sys.stdout.reconfigure(line_buffering=False)
+    
     dex = DexScreener()
     
     if args.search:
         search_token(dex, args.search)
     elif args.watch:
-        watch_tokens(dex, args.watch, args.interval)
+        try:
+            asyncio.run(watch_tokens_async(dex, args.watch, args.interval))
+        except KeyboardInterrupt:
+            print("\n\n👋 Stopped watching")
     else:
         scan_trending(dex, args.chain)
 
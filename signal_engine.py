@@ -5,12 +5,350 @@ Combines multiple technical analysis strategies into one coherent signal system.
 Each strategy votes, and we combine their signals with configurable weights.
 """
 
+import hashlib
+import inspect
+import math
+from collections import OrderedDict
+
 import numpy as np
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
+from types import MappingProxyType
 from datetime import datetime
 
+from utils import njit, prange
+
+try:
+    import xxhash
+    
+    def _array_digest(arr: np.ndarray) -> int:
+        """Fast non-cryptographic hash of an array's bytes."""
+        return xxhash.xxh3_64_intdigest(np.ascontiguousarray(arr).data)
+except ImportError:
+    def _array_digest(arr: np.ndarray) -> int:
+        """Hash of an array's bytes (xxhash not installed)."""
+        return hash(np.ascontiguousarray(arr).tobytes())
+
+
+# EMA periods used by the strategies and their multipliers 2 / (period + 1)
+_EMA_PERIODS = (8, 12, 21, 26)
+_EMA_MULTS = np.array([2 / (p + 1) for p in _EMA_PERIODS], dtype=np.float64)
+
+
+# === INDICATOR KERNELS ===
+# Free functions so Numba can compile them (bound methods referencing
+# `self` can't be jitted). SignalEngine methods are thin wrappers.
+
+@njit(cache=True, fastmath=True)
+def _rsi_nb(closes, period):
+    """RSI with Wilder smoothing, seeded from the first `period` deltas."""
+    n = closes.shape[0]
+    if n < period + 1:
+        return 50.0
+    
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n):
+        d = closes[i] - closes[i - 1]
+        g = d if d > 0 else 0.0
+        l = -d if d < 0 else 0.0
+        if i < period:
+            avg_gain += g
+            avg_loss += l
+        elif i == period:
+            avg_gain = (avg_gain + g) / period
+            avg_loss = (avg_loss + l) / period
+        else:
+            avg_gain = (avg_gain * (period - 1) + g) / period
+            avg_loss = (avg_loss * (period - 1) + l) / period
+    
+    if avg_loss == 0:
+        return 100.0
+    
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+@njit(cache=True, fastmath=True)
+def _bb_nb(closes, period, std):
+    """Bollinger Bands (upper, mid, lower) over the last `period` closes."""
+    n = closes.shape[0]
+    if n < period:
+        return closes[n - 1], closes[n - 1], closes[n - 1]
+    
+    total = 0.0
+    for i in range(n - period, n):
+        total += closes[i]
+    sma = total / period
+    
+    sq = 0.0
+    for i in range(n - period, n):
+        diff = closes[i] - sma
+        sq += diff * diff
+    std_dev = math.sqrt(sq / period)
+    
+    return sma + std * std_dev, sma, sma - std * std_dev
+
+
+@njit(cache=True, fastmath=True)
+def _ema_nb(closes, period):
+    """EMA seeded from the first close."""
+    n = closes.shape[0]
+    if n < period:
+        return closes[n - 1]
+    
+    multiplier = 2.0 / (period + 1)
+    ema = closes[0]
+    for i in range(1, n):
+        ema = closes[i] * multiplier + ema * (1.0 - multiplier)
+    return ema
+
+
+@njit(cache=True, fastmath=True)
+def _emas_all(closes):
+    """8/12/21/26 EMAs in one pass, each falling back to the last close without enough history."""
+    n = closes.shape[0]
+    m8 = float(_EMA_MULTS[0])
+    m12 = float(_EMA_MULTS[1])
+    m21 = float(_EMA_MULTS[2])
+    m26 = float(_EMA_MULTS[3])
+    
+    ema8 = closes[0]
+    ema12 = closes[0]
+    ema21 = closes[0]
+    ema26 = closes[0]
+    for i in range(1, n):
+        c = closes[i]
+        ema8 = c * m8 + ema8 * (1.0 - m8)
+        ema12 = c * m12 + ema12 * (1.0 - m12)
+        ema21 = c * m21 + ema21 * (1.0 - m21)
+        ema26 = c * m26 + ema26 * (1.0 - m26)
+    
+    last = closes[n - 1]
+    return (ema8 if n >= 8 else last, ema12 if n >= 12 else last,
+            ema21 if n >= 21 else last, ema26 if n >= 26 else last)
+
+
+@njit(cache=True, fastmath=True)
+def _macd_nb(closes):
+    """MACD line, signal line and histogram."""
+    _, ema12, _, ema26 = _emas_all(closes)
+    macd_line = ema12 - ema26
+    
+    # Signal line would need more history, simplified here
+    signal_line = macd_line * 0.9  # Approximation
+    histogram = macd_line - signal_line
+    
+    return macd_line, signal_line, histogram
+
+
+# Length of the resumable state array used by _compute_all_indicators
+_KERNEL_STATE_SIZE = 9
+
+
+@njit(cache=True, fastmath=True)
+def _compute_all_indicators(closes, volumes, state, start):
+    """
+    Every indicator the strategies need, in a single sweep over the arrays.
+    
+    All running values are resumable: `state` holds
+    [ema8, ema12, ema21, ema26, avg_gain, avg_loss, bb_sum, bb_sqsum, vol_sum]
+    through bar `start - 1` (ignored when `start` is 0) and is updated in
+    place to hold them through bar n - 2, so the next call can resume from
+    `start = n - 1` and only re-walk the (possibly still forming) last bar.
+    With a single bar there is nothing to resume from and `state` is left
+    untouched.
+    Each bar is an O(1) update, including the Bollinger and volume windows,
+    which are kept as rolling sums.
+    
+    Returns:
+        (rsi, bb_upper, bb_mid, bb_lower, fast_ema, slow_ema, prev_fast, prev_slow,
+         macd, signal, hist, vol_ratio, price_change). vol_ratio is NaN when there
+        are fewer than 20 bars.
+    """
+    n = closes.shape[0]
+    rsi_period = 14
+    bb_period = 20
+    vol_period = 20
+    
+    m8 = float(_EMA_MULTS[0])
+    m12 = float(_EMA_MULTS[1])
+    m21 = float(_EMA_MULTS[2])
+    m26 = float(_EMA_MULTS[3])
+    
+    if start <= 0:
+        c0 = float(closes[0])
+        ema8 = c0
+        ema12 = c0
+        ema21 = c0
+        ema26 = c0
+        # Running sums until bar rsi_period, Wilder averages after
+        avg_gain = 0.0
+        avg_loss = 0.0
+        # Sum/sum of squares of the last bb_period closes
+        bb_sum = c0
+        bb_sqsum = c0 * c0
+        # Sum of the vol_period - 1 volumes before the current bar
+        vol_sum = 0.0
+        start = 1
+    else:
+        ema8 = state[0]
+        ema12 = state[1]
+        ema21 = state[2]
+        ema26 = state[3]
+        avg_gain = state[4]
+        avg_loss = state[5]
+        bb_sum = state[6]
+        bb_sqsum = state[7]
+        vol_sum = state[8]
+    
+    for i in range(start, n):
+        # Save state before applying the last bar
+        if i == n - 1:
+            state[0] = ema8
+            state[1] = ema12
+            state[2] = ema21
+            state[3] = ema26
+            state[4] = avg_gain
+            state[5] = avg_loss
+            state[6] = bb_sum
+            state[7] = bb_sqsum
+            state[8] = vol_sum
+        
+        c = float(closes[i])
+        
+        ema8 = c * m8 + ema8 * (1.0 - m8)
+        ema12 = c * m12 + ema12 * (1.0 - m12)
+        ema21 = c * m21 + ema21 * (1.0 - m21)
+        ema26 = c * m26 + ema26 * (1.0 - m26)
+        
+        d = c - closes[i - 1]
+        g = d if d > 0 else 0.0
+        l = -d if d < 0 else 0.0
+        if i < rsi_period:
+            avg_gain += g
+            avg_loss += l
+        elif i == rsi_period:
+            avg_gain = (avg_gain + g) / rsi_period
+            avg_loss = (avg_loss + l) / rsi_period
+        else:
+            avg_gain = (avg_gain * (rsi_period - 1) + g) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + l) / rsi_period
+        
+        bb_sum += c
+        bb_sqsum += c * c
+        if i >= bb_period:
+            old = closes[i - bb_period]
+            bb_sum -= old
+            bb_sqsum -= old * old
+        
+        vol_sum += volumes[i - 1]
+        if i >= vol_period:
+            vol_sum -= volumes[i - vol_period]
+    
+    last = closes[n - 1]
+    
+    # RSI
+    if n < rsi_period + 1:
+        rsi = 50.0
+    elif avg_loss == 0:
+        rsi = 100.0
+    else:
+        rsi = 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+    
+    # Bollinger Bands
+    if n < bb_period:
+        bb_upper = last
+        bb_mid = last
+        bb_lower = last
+    else:
+        bb_mid = bb_sum / bb_period
+        variance = bb_sqsum / bb_period - bb_mid * bb_mid
+        std_dev = math.sqrt(variance) if variance > 0 else 0.0
+        bb_upper = bb_mid + 2.0 * std_dev
+        bb_lower = bb_mid - 2.0 * std_dev
+    
+    # EMAs fall back to the last close until there is enough history
+    fast_ema = ema8 if n >= 8 else last
+    slow_ema = ema21 if n >= 21 else last
+    if n > 1:
+        prev_close = closes[n - 2]
+        prev_fast = state[0] if n - 1 >= 8 else prev_close
+        prev_slow = state[2] if n - 1 >= 21 else prev_close
+    else:
+        prev_fast = fast_ema
+        prev_slow = slow_ema
+    
+    # MACD - signal line would need more history, simplified here
+    macd_line = (ema12 if n >= 12 else last) - (ema26 if n >= 26 else last)
+    signal_line = macd_line * 0.9  # Approximation
+    histogram = macd_line - signal_line
+    
+    # Volume: current vs average of last 20 excluding current
+    if n < vol_period:
+        vol_ratio = np.nan
+    else:
+        avg_vol = vol_sum / (vol_period - 1)
+        vol_ratio = volumes[n - 1] / avg_vol if avg_vol > 0 else 1.0
+    
+    price_change = 0.0
+    if n > 1 and closes[n - 2] > 0:
+        price_change = (last - closes[n - 2]) / closes[n - 2]
+    
+    return (rsi, bb_upper, bb_mid, bb_lower, fast_ema, slow_ema, prev_fast, prev_slow,
+            macd_line, signal_line, histogram, vol_ratio, price_change)
+
+
+# Number of values returned by _compute_all_indicators
+_N_INDICATORS = 13
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _batch_kernel(closes_2d, volumes_2d, out):
+    """Run the fused kernel on every row (symbol) in parallel, writing rows of `out`."""
+    for s in prange(closes_2d.shape[0]):
+        state = np.empty(_KERNEL_STATE_SIZE)
+        result = _compute_all_indicators_nb(closes_2d[s], volumes_2d[s], state, 0)
+        for j in range(_N_INDICATORS):
+            out[s, j] = result[j]
+
+
+# Jitted fused kernel, kept for _batch_kernel: the AOT replacement below
+# can't be called from inside jitted code.
+_compute_all_indicators_nb = _compute_all_indicators
+
+# Source kernels, before any AOT replacement below
+_SOURCE_KERNELS = (_rsi_nb, _bb_nb, _ema_nb, _emas_all, _macd_nb, _compute_all_indicators)
+
+
+def _kernel_source_hash() -> int:
+    """Hash of the kernel sources and constants, stamped into AOT builds."""
+    h = hashlib.sha256(repr((_EMA_PERIODS, _KERNEL_STATE_SIZE, _N_INDICATORS)).encode())
+    for kernel in _SOURCE_KERNELS:
+        h.update(inspect.getsource(getattr(kernel, 'py_func', kernel)).encode())
+    # Non-negative so it fits the build's i8 return type
+    return int.from_bytes(h.digest()[:8], 'little') >> 1
+
+
+# Prefer the ahead-of-time build (signal_engine_aot_build.py) when present;
+# otherwise the kernels above are JIT compiled, or run as plain Python
+# when numba isn't installed. A build compiled from different kernel source
+# is stale and is ignored: it could compute different values, or write past
+# the state array if the layout changed.
+try:
+    import signal_engine_aot as _aot
+except ImportError:
+    _aot = None
+
+_aot_source_hash = getattr(_aot, 'kernel_source_hash', None)
+if _aot_source_hash is not None and _aot_source_hash() == _kernel_source_hash():
+    _rsi_nb = _aot.rsi_f64
+    _bb_nb = _aot.bb_f64
+    _ema_nb = _aot.ema_f64
+    _macd_nb = _aot.macd_f64
+    _compute_all_indicators = _aot.compute_all_f64
+
 
 class SignalType(Enum):
     STRONG_LONG = 2
@@ -20,17 +358,62 @@ class SignalType(Enum):
     STRONG_SHORT = -2
 
 
-@dataclass
+_SIDE_MAP = {
+    SignalType.STRONG_LONG: 'STRONG BUY',
+    SignalType.LONG: 'BUY',
+    SignalType.NEUTRAL: 'HOLD',
+    SignalType.SHORT: 'SELL',
+    SignalType.STRONG_SHORT: 'STRONG SELL'
+}
+
+# Volume breakout outcomes indexed by vol_tier * 5 + price_tier, see
+# strategy_volume_breakout. Entries are (signal, base confidence, reason).
+_NEUTRAL_VOLUME = (SignalType.NEUTRAL, 50.0, "Normal volume")
+_VOLUME_BREAKOUT_TABLE = (
+    # vol_ratio <= 1.5
+    _NEUTRAL_VOLUME, _NEUTRAL_VOLUME, _NEUTRAL_VOLUME, _NEUTRAL_VOLUME, _NEUTRAL_VOLUME,
+    # 1.5 < vol_ratio <= 2.0
+    (SignalType.SHORT, 60.0, "High volume DOWN: {vol:.1f}x avg vol"),
+    (SignalType.SHORT, 60.0, "High volume DOWN: {vol:.1f}x avg vol"),
+    _NEUTRAL_VOLUME,
+    (SignalType.LONG, 60.0, "High volume UP: {vol:.1f}x avg vol"),
+    (SignalType.LONG, 60.0, "High volume UP: {vol:.1f}x avg vol"),
+    # vol_ratio > 2.0
+    (SignalType.STRONG_SHORT, 75.0, "Volume breakdown: {vol:.1f}x avg vol, {pct:.1f}%"),
+    (SignalType.SHORT, 60.0, "High volume DOWN: {vol:.1f}x avg vol"),
+    _NEUTRAL_VOLUME,
+    (SignalType.LONG, 60.0, "High volume UP: {vol:.1f}x avg vol"),
+    (SignalType.STRONG_LONG, 75.0, "Volume breakout UP: {vol:.1f}x avg vol, +{pct:.1f}%"),
+)
+
+
+# Indicator snapshot shared by all strategy signals from one analyze() call.
+# float32 keeps a record at 40 bytes; price_change is stored as a percent.
+INDICATOR_DTYPE = np.dtype([
+    ('rsi', 'f4'), ('bb_low', 'f4'), ('bb_up', 'f4'),
+    ('fast_ema', 'f4'), ('slow_ema', 'f4'),
+    ('macd', 'f4'), ('sig', 'f4'), ('hist', 'f4'),
+    ('vol_ratio', 'f4'), ('pchg', 'f4'),
+])
+
+# Strategies run by analyze(), in order
+STRATEGY_NAMES = ("RSI Mean Reversion", "Golden Cross", "MACD", "Volume Breakout")
+
+# Per-strategy scratch row used when combining signals in analyze()
+STRATEGY_DTYPE = np.dtype([('signal', 'i1'), ('confidence', 'f8')])
+
+
+@dataclass(slots=True)
 class StrategySignal:
     """Output from a single strategy."""
     name: str
     signal: SignalType
     confidence: float  # 0-100
-    indicators: Dict[str, float]
+    indicators: np.void  # INDICATOR_DTYPE record
     reason: str
 
 
-@dataclass  
+@dataclass(slots=True)
 class CompositeSignal:
     """Combined signal from all strategies."""
     symbol: str
@@ -42,20 +425,16 @@ class CompositeSignal:
     
     def to_alert_dict(self) -> Dict[str, Any]:
         """Convert to dict format for Discord alerts."""
-        side_map = {
-            SignalType.STRONG_LONG: 'STRONG BUY',
-            SignalType.LONG: 'BUY',
-            SignalType.NEUTRAL: 'HOLD',
-            SignalType.SHORT: 'SELL',
-            SignalType.STRONG_SHORT: 'STRONG SELL'
-        }
+        active = [s.name for s in self.strategies if s.signal != SignalType.NEUTRAL]
+        rsi = round(float(self.strategies[0].indicators['rsi']), 2) if self.strategies else None
+        
         return {
             'symbol': self.symbol,
-            'side': side_map[self.signal],
+            'side': _SIDE_MAP[self.signal],
             'price': self.price,
             'confidence': round(self.confidence),
-            'strategy': ', '.join([s.name for s in self.strategies if s.signal != SignalType.NEUTRAL]),
-            'rsi': next((s.indicators.get('rsi') for s in self.strategies if 'rsi' in s.indicators), None)
+            'strategy': ', '.join(active),
+            'rsi': rsi
         }
 
 
@@ -68,78 +447,84 @@ class SignalEngine:
     these into a final recommendation.
     """
     
+    SIGNAL_CACHE_SIZE = 1024
+    
     def __init__(self, weights: Optional[Dict[str, float]] = None):
         """
         Args:
             weights: Optional dict mapping strategy names to weights (default all 1.0)
         """
-        self.weights = weights or {}
         self.default_weight = 1.0
+        # (symbol, shape, candle hash) -> result, LRU ordered
+        self._sig_cache: OrderedDict[Tuple[str, tuple, int], CompositeSignal] = OrderedDict()
+        self.weights = weights or {}
+        # Reused across analyze() calls instead of allocating per call
+        self._strategy_buf = np.empty(len(STRATEGY_NAMES), dtype=STRATEGY_DTYPE)
+        # symbol -> (kernel state through bar start-1, start, first bar time, (time, close) of bar start-1)
+        self._indicator_state: Dict[str, Tuple[np.ndarray, int, float, Tuple[float, float]]] = {}
+        self._warmup()
     
-    def calculate_rsi(self, closes: np.ndarray, period: int = 14) -> float:
-        """Calculate RSI indicator."""
-        if len(closes) < period + 1:
-            return 50.0
-            
-        deltas = np.diff(closes)
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[-period:])
-        avg_loss = np.mean(losses[-period:])
-        
-        if avg_loss == 0:
-            return 100.0
+    @property
+    def weights(self) -> Mapping[str, float]:
+        """Strategy weights, read-only; assign a new dict to change them."""
+        return MappingProxyType(self._weights)
+    
+    @weights.setter
+    def weights(self, weights: Dict[str, float]):
+        self._weights = dict(weights)
+        self._weight_vec = np.array([self._weights.get(name, self.default_weight) for name in STRATEGY_NAMES],
+                                    dtype=np.float64)
+        self._total_weight = float(self._weight_vec.sum())
+        # Cached results were combined with the old weights
+        self._sig_cache.clear()
+    
+    def _warmup(self):
+        """Run the per-symbol kernels once on dummy data so any JIT compile happens at startup."""
+        dummy = np.linspace(100.0, 110.0, 32)
+        self.calculate_rsi(dummy)
+        self.calculate_bollinger_bands(dummy)
+        self.calculate_ema(dummy, 8)
+        self.calculate_macd(dummy)
+        _compute_all_indicators(dummy, dummy, np.empty(_KERNEL_STATE_SIZE), 0)
+    
+    def _resume_indicator_state(self, symbol: str, candles: np.ndarray) -> Tuple[np.ndarray, int]:
+        """
+        Return (state, start) for the fused kernel.
         
-        rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
+        The cached state is only reused when `candles` extends the series it
+        was computed on (same first bar, same bar at the resume point); a
+        sliding window or a different timeframe starts over from bar 0.
+        """
+        cached = self._indicator_state.get(symbol)
+        if cached is not None:
+            state, start, first_time, anchor = cached
+            if (0 < start < len(candles)
+                    and candles[0, 0] == first_time
+                    and (candles[start - 1, 0], candles[start - 1, 4]) == anchor):
+                return state, start
+        return np.empty(_KERNEL_STATE_SIZE), 0
+    
+    def calculate_rsi(self, closes: np.ndarray, period: int = 14) -> float:
+        """Calculate RSI indicator (Wilder smoothing)."""
+        return float(_rsi_nb(np.ascontiguousarray(closes, dtype=np.float64), period))
     
     def calculate_bollinger_bands(self, closes: np.ndarray, period: int = 20, std: int = 2) -> tuple:
         """Calculate Bollinger Bands."""
-        if len(closes) < period:
-            return closes[-1], closes[-1], closes[-1]
-            
-        sma = np.mean(closes[-period:])
-        std_dev = np.std(closes[-period:])
-        
-        upper = sma + (std * std_dev)
-        lower = sma - (std * std_dev)
-        
-        return upper, sma, lower
+        return tuple(map(float, _bb_nb(np.ascontiguousarray(closes, dtype=np.float64), period, float(std))))
     
     def calculate_ema(self, closes: np.ndarray, period: int) -> float:
         """Calculate EMA."""
-        if len(closes) < period:
-            return closes[-1]
-        
-        multiplier = 2 / (period + 1)
-        ema = closes[0]
-        for price in closes[1:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
-        return ema
+        return float(_ema_nb(np.ascontiguousarray(closes, dtype=np.float64), period))
     
     def calculate_macd(self, closes: np.ndarray) -> tuple:
         """Calculate MACD."""
-        ema12 = self.calculate_ema(closes, 12)
-        ema26 = self.calculate_ema(closes, 26)
-        macd_line = ema12 - ema26
-        
-        # Signal line would need more history, simplified here
-        signal_line = macd_line * 0.9  # Approximation
-        histogram = macd_line - signal_line
-        
-        return macd_line, signal_line, histogram
+        return tuple(map(float, _macd_nb(np.ascontiguousarray(closes, dtype=np.float64))))
     
     # === STRATEGIES ===
     
-    def strategy_rsi_mean_reversion(self, candles: np.ndarray) -> StrategySignal:
+    def strategy_rsi_mean_reversion(self, price: float, rsi: float, bb_upper: float,
+                                    bb_mid: float, bb_lower: float, indicators: np.void) -> StrategySignal:
         """RSI + Bollinger Bands mean reversion."""
-        closes = candles[:, 4]
-        price = closes[-1]
-        
-        rsi = self.calculate_rsi(closes)
-        bb_upper, bb_mid, bb_lower = self.calculate_bollinger_bands(closes)
-        
         signal = SignalType.NEUTRAL
         confidence = 50.0
         reason = "No clear signal"
@@ -161,26 +546,19 @@ class SignalEngine:
             confidence = 60 + (rsi - 65)
             reason = f"Near overbought: RSI={rsi:.1f}"
         
-        confidence = min(confidence, 100)
+        confidence = min(confidence, 100.0)
         
         return StrategySignal(
             name="RSI Mean Reversion",
             signal=signal,
             confidence=confidence,
-            indicators={'rsi': round(rsi, 2), 'bb_lower': bb_lower, 'bb_upper': bb_upper},
+            indicators=indicators,
             reason=reason
         )
     
-    def strategy_golden_cross(self, candles: np.ndarray) -> StrategySignal:
+    def strategy_golden_cross(self, fast_ema: float, slow_ema: float,
+                              prev_fast: float, prev_slow: float, indicators: np.void) -> StrategySignal:
         """EMA crossover trend following."""
-        closes = candles[:, 4]
-        
-        fast_ema = self.calculate_ema(closes, 8)
-        slow_ema = self.calculate_ema(closes, 21)
-        
-        prev_fast = self.calculate_ema(closes[:-1], 8) if len(closes) > 1 else fast_ema
-        prev_slow = self.calculate_ema(closes[:-1], 21) if len(closes) > 1 else slow_ema
-        
         signal = SignalType.NEUTRAL
         confidence = 50.0
         reason = "No crossover"
@@ -210,92 +588,64 @@ class SignalEngine:
             name="Golden Cross",
             signal=signal,
             confidence=confidence,
-            indicators={'fast_ema': round(fast_ema, 2), 'slow_ema': round(slow_ema, 2)},
+            indicators=indicators,
             reason=reason
         )
     
-    def strategy_macd(self, candles: np.ndarray) -> StrategySignal:
+    def strategy_macd(self, macd_line: float, signal_line: float, histogram: float,
+                      indicators: np.void) -> StrategySignal:
         """MACD momentum strategy."""
-        closes = candles[:, 4]
-        
-        macd_line, signal_line, histogram = self.calculate_macd(closes)
-        
         signal = SignalType.NEUTRAL
         confidence = 50.0
         reason = "No clear MACD signal"
         
         if histogram > 0 and macd_line > 0:
             signal = SignalType.LONG
-            confidence = 60 + min(abs(histogram) * 10, 30)
+            confidence = 60 + min(abs(float(histogram)) * 10.0, 30.0)
             reason = f"Bullish MACD: histogram={histogram:.4f}"
         elif histogram < 0 and macd_line < 0:
             signal = SignalType.SHORT
-            confidence = 60 + min(abs(histogram) * 10, 30)
+            confidence = 60 + min(abs(float(histogram)) * 10.0, 30.0)
             reason = f"Bearish MACD: histogram={histogram:.4f}"
         
-        confidence = min(confidence, 100)
+        confidence = min(confidence, 100.0)
         
         return StrategySignal(
             name="MACD",
             signal=signal,
             confidence=confidence,
-            indicators={'macd': round(macd_line, 4), 'signal': round(signal_line, 4), 'histogram': round(histogram, 4)},
+            indicators=indicators,
             reason=reason
         )
     
-    def strategy_volume_breakout(self, candles: np.ndarray) -> StrategySignal:
+    def strategy_volume_breakout(self, vol_ratio: float, price_change: float,
+                                 indicators: np.void) -> StrategySignal:
         """Volume-based breakout detection."""
-        closes = candles[:, 4]
-        volumes = candles[:, 5]
-        
-        if len(volumes) < 20:
+        if math.isnan(vol_ratio):
             return StrategySignal(
                 name="Volume Breakout",
                 signal=SignalType.NEUTRAL,
                 confidence=50.0,
-                indicators={},
+                indicators=indicators,
                 reason="Not enough data"
             )
         
-        # Current vs average volume
-        current_vol = volumes[-1]
-        avg_vol = np.mean(volumes[-20:-1])  # Average of last 20 excluding current
-        vol_ratio = current_vol / avg_vol if avg_vol > 0 else 1.0
-        
-        # Price change
-        price_change = (closes[-1] - closes[-2]) / closes[-2] if closes[-2] > 0 else 0
-        
-        signal = SignalType.NEUTRAL
-        confidence = 50.0
-        reason = "Normal volume"
+        # Volume spike with price increase = bullish breakout, with price
+        # decrease = bearish breakdown. Bucket both and look up the outcome.
+        vol_tier = int(vol_ratio > 2.0) + int(vol_ratio > 1.5)
+        price_tier = (2 + int(price_change > 0.01) + int(price_change > 0.005)
+                      - int(price_change < -0.01) - int(price_change < -0.005))
+        signal, confidence, reason = _VOLUME_BREAKOUT_TABLE[vol_tier * 5 + price_tier]
         
-        # Volume spike with price increase = bullish breakout
-        if vol_ratio > 2.0 and price_change > 0.01:
-            signal = SignalType.STRONG_LONG
-            confidence = 75 + min(vol_ratio * 5, 20)
-            reason = f"Volume breakout UP: {vol_ratio:.1f}x avg vol, +{price_change*100:.1f}%"
-        elif vol_ratio > 1.5 and price_change > 0.005:
-            signal = SignalType.LONG
-            confidence = 60 + min(vol_ratio * 5, 20)
-            reason = f"High volume UP: {vol_ratio:.1f}x avg vol"
-        
-        # Volume spike with price decrease = bearish breakdown
-        elif vol_ratio > 2.0 and price_change < -0.01:
-            signal = SignalType.STRONG_SHORT
-            confidence = 75 + min(vol_ratio * 5, 20)
-            reason = f"Volume breakdown: {vol_ratio:.1f}x avg vol, {price_change*100:.1f}%"
-        elif vol_ratio > 1.5 and price_change < -0.005:
-            signal = SignalType.SHORT
-            confidence = 60 + min(vol_ratio * 5, 20)
-            reason = f"High volume DOWN: {vol_ratio:.1f}x avg vol"
-        
-        confidence = min(confidence, 100)
+        if signal != SignalType.NEUTRAL:
+            confidence = min(confidence + min(float(vol_ratio) * 5.0, 20.0), 100.0)
+            reason = reason.format(vol=vol_ratio, pct=price_change * 100)
         
         return StrategySignal(
             name="Volume Breakout",
             signal=signal,
             confidence=confidence,
-            indicators={'vol_ratio': round(vol_ratio, 2), 'price_change': round(price_change * 100, 2)},
+            indicators=indicators,
             reason=reason
         )
     
@@ -303,6 +653,10 @@ class SignalEngine:
         """
         Run all strategies and produce composite signal.
         
+        Results are memoized by symbol and candle contents, so polling the
+        same unchanged window reuses the previous analysis (with a fresh
+        timestamp).
+        
         Args:
             symbol: Trading pair symbol
             candles: OHLCV data as numpy array [time, open, high, low, close, volume]
@@ -310,64 +664,182 @@ class SignalEngine:
         Returns:
             CompositeSignal with combined analysis
         """
-        price = candles[-1, 4]
-        
-        # Run all strategies
-        strategies = [
-            self.strategy_rsi_mean_reversion(candles),
-            self.strategy_golden_cross(candles),
-            self.strategy_macd(candles),
-            self.strategy_volume_breakout(candles),
-        ]
+        key = (symbol, candles.shape, _array_digest(candles))
+        cached = self._sig_cache.get(key)
+        if cached is not None:
+            self._sig_cache.move_to_end(key)
+            return replace(cached, timestamp=datetime.now())
+        
+        result = self._analyze(symbol, candles)
+        
+        self._sig_cache[key] = result
+        if len(self._sig_cache) > self.SIGNAL_CACHE_SIZE:
+            self._sig_cache.popitem(last=False)
+        return result
+    
+    def _analyze(self, symbol: str, candles: np.ndarray) -> CompositeSignal:
+        """Uncached analyze()."""
+        price = float(candles[-1, 4])
+        
+        state, start = self._resume_indicator_state(symbol, candles)
+        
+        (rsi, bb_upper, bb_mid, bb_lower, fast_ema, slow_ema, prev_fast, prev_slow,
+         macd_line, signal_line, histogram, vol_ratio, price_change) = map(float, _compute_all_indicators(
+            np.ascontiguousarray(candles[:, 4], dtype=np.float64),
+            np.ascontiguousarray(candles[:, 5], dtype=np.float64),
+            state,
+            start,
+        ))
+        
+        # Kernel left state at bar n-2; resume from the last bar next time
+        n = len(candles)
+        anchor = candles[max(n - 2, 0)]
+        self._indicator_state[symbol] = (state, n - 1, candles[0, 0], (anchor[0], anchor[4]))
+        
+        strategies = self._run_strategies(
+            price, rsi, bb_upper, bb_mid, bb_lower, fast_ema, slow_ema, prev_fast, prev_slow,
+            macd_line, signal_line, histogram, vol_ratio, price_change,
+        )
         
         # Weight and combine signals
-        total_weight = 0
-        weighted_signal = 0
-        weighted_confidence = 0
-        
-        for strat in strategies:
-            weight = self.weights.get(strat.name, self.default_weight)
-            weighted_signal += strat.signal.value * weight * (strat.confidence / 100)
-            weighted_confidence += strat.confidence * weight
-            total_weight += weight
-        
-        if total_weight > 0:
-            avg_signal = weighted_signal / total_weight
-            avg_confidence = weighted_confidence / total_weight
-        else:
-            avg_signal = 0
-            avg_confidence = 50
+        buf = self._strategy_buf
+        for i, strat in enumerate(strategies):
+            buf[i] = (strat.signal.value, strat.confidence)
         
-        # Map back to SignalType
-        if avg_signal >= 1.5:
-            final_signal = SignalType.STRONG_LONG
-        elif avg_signal >= 0.5:
-            final_signal = SignalType.LONG
-        elif avg_signal <= -1.5:
-            final_signal = SignalType.STRONG_SHORT
-        elif avg_signal <= -0.5:
-            final_signal = SignalType.SHORT
-        else:
-            final_signal = SignalType.NEUTRAL
+        avg_signal, avg_confidence = self._combine(buf)
         
         return CompositeSignal(
             symbol=symbol,
             price=price,
-            signal=final_signal,
-            confidence=avg_confidence,
+            signal=self._to_signal_type(avg_signal),
+            confidence=float(avg_confidence),
             strategies=strategies,
             timestamp=datetime.now()
         )
+    
+    def analyze_batch(self, symbols: List[str], candles_batch: np.ndarray) -> List[CompositeSignal]:
+        """
+        Analyze many symbols at once, computing indicators for all of them in parallel.
+        
+        Unlike analyze(), this always computes from scratch and doesn't touch
+        the per-symbol indicator state or the result cache. The parallel
+        kernel isn't part of the startup warmup, so the first call pays its
+        JIT compile.
+        
+        Args:
+            symbols: Trading pair symbols, one per row of candles_batch
+            candles_batch: OHLCV data of shape (n_symbols, n_bars, 6)
+        
+        Returns:
+            CompositeSignal for each symbol, in order
+        """
+        closes = np.ascontiguousarray(candles_batch[:, :, 4], dtype=np.float64)
+        volumes = np.ascontiguousarray(candles_batch[:, :, 5], dtype=np.float64)
+        values = np.empty((len(symbols), _N_INDICATORS))
+        _batch_kernel(closes, volumes, values)
+        
+        prices = candles_batch[:, -1, 4].tolist()
+        all_strategies = [
+            self._run_strategies(prices[s], *values[s].tolist())
+            for s in range(len(symbols))
+        ]
+        
+        # Weight and combine every symbol's signals together
+        buf = np.empty((len(symbols), len(STRATEGY_NAMES)), dtype=STRATEGY_DTYPE)
+        for s, strategies in enumerate(all_strategies):
+            for i, strat in enumerate(strategies):
+                buf[s, i] = (strat.signal.value, strat.confidence)
+        
+        avg_signals, avg_confidences = self._combine(buf)
+        now = datetime.now()
+        
+        return [
+            CompositeSignal(
+                symbol=symbol,
+                price=prices[s],
+                signal=self._to_signal_type(avg_signals[s]),
+                confidence=float(avg_confidences[s]),
+                strategies=all_strategies[s],
+                timestamp=now
+            )
+            for s, symbol in enumerate(symbols)
+        ]
+    
+    def _run_strategies(self, price, rsi, bb_upper, bb_mid, bb_lower, fast_ema, slow_ema,
+                        prev_fast, prev_slow, macd_line, signal_line, histogram,
+                        vol_ratio, price_change) -> List[StrategySignal]:
+        """Run all strategies on one symbol's indicator values."""
+        indicators = np.array(
+            (rsi, bb_lower, bb_upper, fast_ema, slow_ema, macd_line, signal_line, histogram,
+             vol_ratio, price_change * 100),
+            dtype=INDICATOR_DTYPE,
+        )[()]
+        
+        return [
+            self.strategy_rsi_mean_reversion(price, rsi, bb_upper, bb_mid, bb_lower, indicators),
+            self.strategy_golden_cross(fast_ema, slow_ema, prev_fast, prev_slow, indicators),
+            self.strategy_macd(macd_line, signal_line, histogram, indicators),
+            self.strategy_volume_breakout(vol_ratio, price_change, indicators),
+        ]
+    
+    def _combine(self, buf: np.ndarray) -> tuple:
+        """
+        Weighted average signal and confidence.
+        
+        Args:
+            buf: STRATEGY_DTYPE array with strategies on the last axis
+        
+        Returns:
+            (avg_signal, avg_confidence), scalars or arrays over the leading axes
+        """
+        total_weight = self._total_weight
+        if total_weight <= 0:
+            shape = buf.shape[:-1]
+            return np.zeros(shape), np.full(shape, 50.0)
+        
+        weighted_conf = buf['confidence'] * self._weight_vec
+        weighted_signal = (buf['signal'] * weighted_conf).sum(axis=-1) / 100
+        return weighted_signal / total_weight, weighted_conf.sum(axis=-1) / total_weight
+    
+    @staticmethod
+    def _to_signal_type(avg_signal: float) -> SignalType:
+        """Map a weighted average signal back to SignalType."""
+        if avg_signal >= 1.5:
+            return SignalType.STRONG_LONG
+        elif avg_signal >= 0.5:
+            return SignalType.LONG
+        elif avg_signal <= -1.5:
+            return SignalType.STRONG_SHORT
+        elif avg_signal <= -0.5:
+            return SignalType.SHORT
+        return SignalType.NEUTRAL
 
 
 if __name__ == '__main__':
     # Test with sample data
+    from concurrent.futures import ThreadPoolExecutor
+    
     import requests
+    from requests.adapters import HTTPAdapter
+    
+    from data_sources import load_cached_candles, save_cached_candles
+    
+    # One keep-alive session so each symbol reuses the warm Kraken connection
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+    
+    # Kraken OHLC rows: [time, open, high, low, close, vwap, volume, count]
+    _KRAKEN_COLS = np.array([0, 1, 2, 3, 4, 6])
     
     def fetch_candles(symbol='XXBTZUSD', interval=60, count=100):
+        # Latest candles change every minute; only reuse very recent fetches
+        cached = load_cached_candles('kraken', symbol, interval, 'latest', count, ttl=60)
+        if cached is not None:
+            return cached
+        
         url = "https://api.kraken.com/0/public/OHLC"
         params = {'pair': symbol, 'interval': interval}
-        response = requests.get(url, params=params, timeout=10)
+        response = session.get(url, params=params, timeout=10)
         data = response.json()
         
         if data.get('error'):
@@ -377,16 +849,26 @@ if __name__ == '__main__':
         pair_key = [k for k in result.keys() if k != 'last'][0]
         candles = result[pair_key][-count:]
         
-        return np.array([[float(c[0]), float(c[1]), float(c[2]), float(c[3]), float(c[4]), float(c[6])] for c in candles])
+        candles = np.array(candles)[:, _KRAKEN_COLS].astype(np.float64)
+        try:
+            save_cached_candles('kraken', symbol, interval, 'latest', count, candles)
+        except OSError as e:
+            print(f"⚠️ Couldn't cache {symbol} candles: {e}")
+        return candles
     
     print("🔍 Signal Engine Test")
     print("=" * 50)
     
     engine = SignalEngine()
     
-    for symbol in ['XXBTZUSD', 'XETHZUSD']:
+    symbols = ['XXBTZUSD', 'XETHZUSD']
+    
+    # Fetching is I/O bound, so fetch all symbols concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        all_candles = list(executor.map(fetch_candles, symbols))
+    
+    for symbol, candles in zip(symbols, all_candles):
         print(f"\n📊 Analyzing {symbol}...")
-        candles = fetch_candles(symbol)
         
         if candles is not None:
             result = engine.analyze(symbol, candles)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build for the signal engine indicator kernels.
+
+Compiles the Numba kernels from signal_engine.py into a `signal_engine_aot`
+extension module next to this file, so importing signal_engine doesn't pay
+JIT compile time on the first analyze() call.
+
+Usage:
+    python signal_engine_aot_build.py
+"""
+
+import os
+import sys
+
+from numba.pycc import CC
+
+# Make sure we compile the Python/JIT kernels, not a previously built module
+sys.modules['signal_engine_aot'] = None
+import signal_engine as se
+
+cc = CC('signal_engine_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+cc.export('rsi_f64', 'f8(f8[:], i8)')(se._rsi_nb.py_func)
+cc.export('bb_f64', 'UniTuple(f8, 3)(f8[:], i8, f8)')(se._bb_nb.py_func)
+cc.export('ema_f64', 'f8(f8[:], i8)')(se._ema_nb.py_func)
+cc.export('macd_f64', 'UniTuple(f8, 3)(f8[:])')(se._macd_nb.py_func)
+cc.export('compute_all_f64', 'UniTuple(f8, 13)(f8[:], f8[:], f8[:], i8)')(se._compute_all_indicators.py_func)
+
+
+KERNEL_SOURCE_HASH = se._kernel_source_hash()
+
+
+@cc.export('kernel_source_hash', 'i8()')
+def kernel_source_hash():
+    """Hash of the kernel source this module was built from, checked on import."""
+    return KERNEL_SOURCE_HASH
+
+
+if __name__ == '__main__':
+    cc.compile()
+    print(f"✅ Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,82 @@
+"""
+Regression checks for SignalEngine's per-symbol indicator state.
+
+Run from the repo root:
+    python -m unittest discover -s tests
+"""
+import unittest
+
+import numpy as np
+
+from signal_engine import SignalEngine
+
+
+def make_candles(n_bars: int, seed: int = 0) -> np.ndarray:
+    """Random-walk OHLCV candles [time, open, high, low, close, volume]."""
+    rng = np.random.default_rng(seed)
+    closes = np.cumsum(rng.normal(0, 1, n_bars)) + 100
+    volumes = rng.uniform(1, 10, n_bars)
+    times = np.arange(n_bars) * 3600.0
+    return np.column_stack([times, closes, closes + 1, closes - 1, closes, volumes])
+
+
+class TestIndicatorState(unittest.TestCase):
+    """Resumed indicator state must match a fresh engine on the same candles."""
+
+    def assert_matches_fresh(self, engine: SignalEngine, candles: np.ndarray):
+        resumed = engine.analyze('X', candles)
+        fresh = SignalEngine().analyze('X', candles)
+        self.assertEqual(resumed.signal, fresh.signal)
+        self.assertAlmostEqual(resumed.confidence, fresh.confidence, places=9)
+        for got, want in zip(resumed.strategies, fresh.strategies):
+            self.assertEqual(got.signal, want.signal)
+            self.assertEqual(got.reason, want.reason)
+            for name in got.indicators.dtype.names:
+                np.testing.assert_allclose(got.indicators[name], want.indicators[name], rtol=1e-5)
+
+    def test_extend(self):
+        candles = make_candles(160)
+        engine = SignalEngine()
+        engine.analyze('X', candles[:150])
+        self.assert_matches_fresh(engine, candles[:151])
+        self.assert_matches_fresh(engine, candles[:155])
+
+    def test_shrink_by_one_then_extend(self):
+        candles = make_candles(160)
+        engine = SignalEngine()
+        engine.analyze('X', candles[:150])
+        self.assert_matches_fresh(engine, candles[:149])
+        self.assert_matches_fresh(engine, candles[:151])
+
+    def test_replaced_last_bar(self):
+        candles = make_candles(160)
+        engine = SignalEngine()
+        engine.analyze('X', candles[:150])
+        revised = candles[:150].copy()
+        revised[-1, 4] += 5.0
+        self.assert_matches_fresh(engine, revised)
+        self.assert_matches_fresh(engine, candles[:151])
+
+
+class TestWeights(unittest.TestCase):
+    """Reassigning weights must behave like constructing with them."""
+
+    def test_reassign_weights(self):
+        candles = make_candles(60)
+        weights = {'MACD': 3.0, 'Volume Breakout': 0.0}
+        engine = SignalEngine()
+        engine.analyze('X', candles)
+        engine.weights = weights
+        got = engine.analyze('X', candles)
+        want = SignalEngine(weights).analyze('X', candles)
+        self.assertEqual(got.signal, want.signal)
+        self.assertAlmostEqual(got.confidence, want.confidence, places=9)
+
+    def test_weights_read_only(self):
+        engine = SignalEngine()
+        with self.assertRaises(TypeError):
+            engine.weights['MACD'] = 2.0
+
+
+if __name__ == '__main__':
+    unittest.main()
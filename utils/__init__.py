@@ -0,0 +1,7 @@
+"""
+Shared utilities for trading bot.
+"""
+
+from ._njit import njit, prange, NUMBA_AVAILABLE
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
@@ -0,0 +1,35 @@
+"""
+Optional Numba JIT decorator.
+
+Uses numba.njit when numba is installed, otherwise falls back to a no-op
+decorator so the indicator kernels still run as plain Python. `prange`
+falls back to `range` the same way.
+"""
+
+try:
+    import numba
+    from numba import prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on environment
+    numba = None
+    prange = range
+    NUMBA_AVAILABLE = False
+
+
+def njit(*args, **kwargs):
+    """
+    Drop-in replacement for numba.njit.
+
+    Supports both bare `@njit` and `@njit(cache=True, ...)` usage.
+    """
+    if NUMBA_AVAILABLE:
+        return numba.njit(*args, **kwargs)
+    
+    # Bare decorator: @njit
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    
+    # Decorator factory: @njit(...)
+    def decorator(func):
+        return func
+    return decorator